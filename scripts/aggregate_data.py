@@ -11,19 +11,58 @@ Usage:
 
 import argparse
 import json
+import math
 import sys
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from statistics import mean, median
 from typing import Optional
 
+import numpy as np
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+# Stream (rather than slurp) validated price files above this size;
+# below it a one-shot orjson parse is faster
+STREAM_THRESHOLD_BYTES = 50 * 1024 * 1024
+
 
 def load_json(path: Path) -> dict:
     """Load JSON file."""
+    if HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
     with open(path) as f:
         return json.load(f)
 
 
+def save_json(data: dict, path: Path) -> None:
+    """
+    Write JSON file with 2-space indentation.
+
+    Serializes to one buffer and writes it to a temp file that is
+    atomically renamed over the target, so a single syscall replaces
+    many small writes and readers never see a torn file.
+    """
+    if HAS_ORJSON:
+        buf = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        buf = (json.dumps(data, indent=2) + "\n").encode()
+
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(buf)
+    tmp.replace(path)
+
+
 def load_cities(script_dir: Path) -> list[dict]:
     """Load target cities."""
     data = load_json(script_dir / "data" / "cities.json")
@@ -36,10 +75,38 @@ def load_minimum_wages(script_dir: Path) -> dict[str, float]:
     return {code: info["hourly_wage"] for code, info in data["wages"].items()}
 
 
-def load_validated_prices(script_dir: Path) -> list[dict]:
-    """Load validated price entries."""
-    data = load_json(script_dir / "data" / "prices_validated.json")
-    return data.get("prices", [])
+def iter_validated_prices(script_dir: Path):
+    """
+    Yield validated price entries.
+
+    Large files are streamed with ijson so memory stays flat; small
+    files (the common case) are parsed in one shot, which is faster.
+    """
+    path = script_dir / "data" / "prices_validated.json"
+    if HAS_IJSON and path.stat().st_size > STREAM_THRESHOLD_BYTES:
+        with open(path, "rb") as f:
+            try:
+                yield from ijson.items(f, "prices.item")
+            except ijson.JSONError as e:
+                # ijson errors don't subclass ValueError; re-raise so
+                # callers see the same family as the one-shot path
+                raise ValueError(f"Invalid JSON in {path.name}: {e}") from e
+    else:
+        yield from load_json(path).get("prices", [])
+
+
+def _stats_kernel(arr: np.ndarray) -> tuple[float, float, float, float]:
+    """Compute (mean, median, min, max) over a float64 buffer."""
+    lo = float(arr.min())
+    hi = float(arr.max())
+    if lo == hi:
+        # Constant array: all four stats collapse, skip mean/median
+        return lo, lo, lo, hi
+    return float(arr.mean()), float(np.median(arr)), lo, hi
+
+
+# Below this many samples a single Timsort beats NumPy's array setup
+SMALL_SAMPLE_CUTOFF = 64
 
 
 def calculate_stats(values: list[float]) -> Optional[dict]:
@@ -47,11 +114,28 @@ def calculate_stats(values: list[float]) -> Optional[dict]:
     if not values:
         return None
 
+    n = len(values)
+    if n < SMALL_SAMPLE_CUTOFF:
+        # Typical per-city case (~15 samples): one sort gives min, max,
+        # and median together, cheaper than building a NumPy array
+        ordered = sorted(values)
+        mid = n // 2
+        if n % 2:
+            median_val = ordered[mid]
+        else:
+            median_val = (ordered[mid - 1] + ordered[mid]) / 2
+        mean_val = math.fsum(values) / n
+        min_val = ordered[0]
+        max_val = ordered[-1]
+    else:
+        arr = np.fromiter(values, dtype=np.float64, count=n)
+        mean_val, median_val, min_val, max_val = _stats_kernel(arr)
+
     return {
-        "mean": round(mean(values), 2),
-        "median": round(median(values), 2),
-        "min": round(min(values), 2),
-        "max": round(max(values), 2),
+        "mean": round(mean_val, 2),
+        "median": round(median_val, 2),
+        "min": round(min_val, 2),
+        "max": round(max_val, 2),
     }
 
 
@@ -59,6 +143,7 @@ def aggregate_city_data(
     city: dict,
     prices: list[dict],
     min_wage: float,
+    affordability_factor: float,
 ) -> dict:
     """
     Aggregate price data for a single city.
@@ -67,26 +152,27 @@ def aggregate_city_data(
         city: City information (name, province, lat, lon)
         prices: List of price entries for this city
         min_wage: Provincial minimum wage
+        affordability_factor: Precomputed 60 / min_wage (0 if no wage),
+            so the inner path is a single multiply
 
     Returns:
         Aggregated city data dictionary
     """
-    # Extract prices by size
-    small_prices = [
-        p["prices"]["small"]
-        for p in prices
-        if p["prices"].get("small") is not None
-    ]
-    regular_prices = [
-        p["prices"]["regular"]
-        for p in prices
-        if p["prices"].get("regular") is not None
-    ]
-    large_prices = [
-        p["prices"]["large"]
-        for p in prices
-        if p["prices"].get("large") is not None
-    ]
+    # Extract prices by size in a single pass over the entries
+    small_prices: list[float] = []
+    regular_prices: list[float] = []
+    large_prices: list[float] = []
+    for p in prices:
+        entry_prices = p["prices"]
+        small = entry_prices.get("small")
+        regular = entry_prices.get("regular")
+        large = entry_prices.get("large")
+        if small is not None:
+            small_prices.append(small)
+        if regular is not None:
+            regular_prices.append(regular)
+        if large is not None:
+            large_prices.append(large)
 
     # Calculate statistics
     price_stats = {
@@ -98,8 +184,8 @@ def aggregate_city_data(
     # Calculate affordability index
     # (regular_price / min_wage) * 60 = minutes of work
     regular_mean = price_stats["regular"]["mean"] if price_stats["regular"] else None
-    if regular_mean is not None and min_wage > 0:
-        affordability_index = round((regular_mean / min_wage) * 60, 2)
+    if regular_mean is not None and affordability_factor:
+        affordability_index = round(regular_mean * affordability_factor, 2)
     else:
         affordability_index = 0
 
@@ -133,25 +219,35 @@ def main():
     print("Loading data...")
     cities = load_cities(script_dir)
     min_wages = load_minimum_wages(script_dir)
-    prices = load_validated_prices(script_dir)
 
     print(f"  {len(cities)} target cities")
     print(f"  {len(min_wages)} provinces with wage data")
-    print(f"  {len(prices)} validated price entries")
 
-    # Group prices by city
-    prices_by_city: dict[str, list[dict]] = {}
-    for entry in prices:
+    # Group prices by city in one pass, counting as we stream; pre-seed
+    # target cities so the later lookups always hit a known key
+    prices_by_city: dict[str, list[dict]] = defaultdict(list)
+    for city in cities:
+        prices_by_city[city["name"]] = []
+    price_count = 0
+    for entry in iter_validated_prices(script_dir):
+        price_count += 1
         city_name = entry.get("city")
         if city_name:
-            if city_name not in prices_by_city:
-                prices_by_city[city_name] = []
             prices_by_city[city_name].append(entry)
 
-    # Aggregate each city
+    print(f"  {price_count} validated price entries")
+
+    # Precompute the affordability multiplier once per province
+    affordability_factors = {
+        province: (60.0 / wage if wage > 0 else 0.0)
+        for province, wage in min_wages.items()
+    }
+
+    # Aggregate each city, batching status output into one write
     print("\nAggregating city data...")
     aggregated_cities = []
     missing_wage = []
+    status_lines = []
 
     for city in cities:
         province = city["province"]
@@ -161,14 +257,18 @@ def main():
             missing_wage.append((city["name"], province))
             min_wage = 0
 
-        city_prices = prices_by_city.get(city["name"], [])
-        aggregated = aggregate_city_data(city, city_prices, min_wage)
+        city_prices = prices_by_city[city["name"]]
+        aggregated = aggregate_city_data(
+            city, city_prices, min_wage, affordability_factors.get(province, 0.0)
+        )
         aggregated_cities.append(aggregated)
 
         status = f"{len(city_prices)} restaurants"
         if not city_prices:
             status = "no data"
-        print(f"  {city['name']}: {status}")
+        status_lines.append(f"  {city['name']}: {status}")
+
+    sys.stdout.write("\n".join(status_lines) + "\n")
 
     # Warn about missing wage data
     if missing_wage:
@@ -185,8 +285,7 @@ def main():
 
     # Save
     output_path = script_dir / args.output
-    with open(output_path, "w") as f:
-        json.dump(output_data, f, indent=2)
+    save_json(output_data, output_path)
 
     print(f"\nSaved aggregated data to {output_path}")
 
@@ -11,14 +11,27 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
 import os
+import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 # Fast food chains to exclude
 FAST_FOOD_BLOCKLIST = {
@@ -47,10 +60,46 @@ FAST_FOOD_BLOCKLIST = {
     "walmart",
 }
 
+# Single compiled pattern so a name is scanned once instead of once per
+# chain; longest needles first so e.g. "mcdonald's" wins over "mcdonald"
+_FAST_FOOD_RE = re.compile(
+    "|".join(sorted(map(re.escape, FAST_FOOD_BLOCKLIST), key=len, reverse=True))
+)
+
+# Minimum quality bar before we spend a Place Details call on a
+# restaurant; entries below it get dropped in price extraction anyway
+MIN_RATING = 3.5
+MIN_RATINGS_TOTAL = 5
+
 # Google Places API endpoints
 PLACES_NEARBY_URL = "https://maps.googleapis.com/maps/api/place/nearbysearch/json"
 PLACES_DETAILS_URL = "https://maps.googleapis.com/maps/api/place/details/json"
 
+# On-disk cache of Places API responses, so re-runs during development
+# don't re-pay the HTTP cost (or the per-call quota)
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "places"
+CACHE_TTL_SECONDS = 30 * 24 * 3600  # 30 days
+
+# Set by --force-refresh to bypass cached responses
+_force_refresh = False
+
+# Shared session: reuses TCP+TLS connections to maps.googleapis.com
+# instead of a fresh handshake per call, and retries transient errors
+_SESSION = requests.Session()
+_SESSION.headers["Accept-Encoding"] = "gzip"
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    ),
+)
+
 
 def get_api_key() -> str:
     """Get Google Places API key from environment."""
@@ -70,15 +119,76 @@ def get_api_key() -> str:
 
 def load_cities(cities_path: Path) -> list[dict]:
     """Load target cities from JSON file."""
-    with open(cities_path) as f:
-        data = json.load(f)
+    if HAS_ORJSON:
+        data = orjson.loads(cities_path.read_bytes())
+    else:
+        with open(cities_path) as f:
+            data = json.load(f)
     return data["cities"]
 
 
+def parse_response(response: requests.Response) -> dict:
+    """Parse a JSON API response body."""
+    if HAS_ORJSON:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def parse_response_bytes(raw: bytes) -> dict:
+    """Parse a raw JSON response body (e.g. from the disk cache)."""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _cache_path(url: str, params: dict) -> Path:
+    """Build the cache file path for an API call (key excluded)."""
+    keyed = {k: v for k, v in sorted(params.items()) if k != "key"}
+    digest = hashlib.sha256(
+        json.dumps([url, keyed], sort_keys=True).encode()
+    ).hexdigest()
+    return CACHE_DIR / f"{digest}.json"
+
+
+def api_get(url: str, params: dict) -> dict:
+    """
+    GET a Places API endpoint, caching responses on disk.
+
+    Responses are deterministic functions of their params (modulo data
+    drift), so warm re-runs become pure cache lookups. Entries expire
+    after CACHE_TTL_SECONDS; --force-refresh bypasses the cache.
+    """
+    path = _cache_path(url, params)
+    if not _force_refresh and path.exists():
+        if time.time() - path.stat().st_mtime < CACHE_TTL_SECONDS:
+            try:
+                return parse_response_bytes(path.read_bytes())
+            except ValueError:
+                # Torn or corrupt cache entry; fall through to a live
+                # fetch, which overwrites it
+                pass
+
+    response = _SESSION.get(url, params=params, timeout=30)
+    response.raise_for_status()
+    data = parse_response(response)
+
+    # Only cache successful responses; API errors should be retried.
+    # Write to a temp file and rename so concurrent workers never see
+    # a half-written entry (same idiom as save_json).
+    if data.get("status") in ("OK", "ZERO_RESULTS"):
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(
+            path.suffix + f".{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        tmp.write_bytes(response.content)
+        tmp.replace(path)
+
+    return data
+
+
 def is_fast_food(name: str) -> bool:
     """Check if restaurant name matches a fast food chain."""
-    name_lower = name.lower()
-    return any(chain in name_lower for chain in FAST_FOOD_BLOCKLIST)
+    return _FAST_FOOD_RE.search(name.lower()) is not None
 
 
 def search_restaurants(
@@ -116,9 +226,7 @@ def search_restaurants(
         if next_page_token:
             params["pagetoken"] = next_page_token
 
-        response = requests.get(PLACES_NEARBY_URL, params=params, timeout=30)
-        response.raise_for_status()
-        data = response.json()
+        data = api_get(PLACES_NEARBY_URL, params)
 
         if data["status"] not in ("OK", "ZERO_RESULTS"):
             print(f"  API error: {data['status']}")
@@ -149,7 +257,6 @@ def search_restaurants(
             break
 
         # Google requires a short delay before using next_page_token
-        import time
         time.sleep(2)
 
     return restaurants
@@ -163,54 +270,87 @@ def get_restaurant_website(api_key: str, place_id: str) -> Optional[str]:
         "fields": "website",
     }
 
-    response = requests.get(PLACES_DETAILS_URL, params=params, timeout=30)
-    response.raise_for_status()
-    data = response.json()
+    data = api_get(PLACES_DETAILS_URL, params)
 
     if data["status"] == "OK":
         return data.get("result", {}).get("website")
     return None
 
 
+def fetch_city_restaurants(
+    api_key: str,
+    city: dict,
+    target_per_city: int = 15,
+    fetch_websites: bool = True,
+) -> list[dict]:
+    """Fetch restaurants (and optionally websites) for a single city."""
+    restaurants = search_restaurants(
+        api_key,
+        city["lat"],
+        city["lon"],
+        max_results=target_per_city,
+    )
+
+    for restaurant in restaurants:
+        restaurant["city"] = city["name"]
+
+    if fetch_websites:
+        # Website lookups cost a Place Details call each; skip entries
+        # that price extraction would discard anyway
+        accepted = [
+            r
+            for r in restaurants
+            if r.get("place_id")
+            and (r.get("rating") or 0) >= MIN_RATING
+            and (r.get("user_ratings_total") or 0) >= MIN_RATINGS_TOTAL
+        ]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            websites = pool.map(
+                lambda r: get_restaurant_website(api_key, r["place_id"]),
+                accepted,
+            )
+            for restaurant, website in zip(accepted, websites):
+                restaurant["website"] = website
+
+    return restaurants
+
+
 def fetch_all_restaurants(
     api_key: str,
     cities: list[dict],
     target_per_city: int = 15,
     fetch_websites: bool = True,
+    max_workers: int = 8,
 ) -> list[dict]:
     """
     Fetch restaurants for all target cities.
 
+    Cities are fetched concurrently; the work is network-bound, so a
+    bounded thread pool cuts wall-clock time roughly linearly with the
+    worker count.
+
     Args:
         api_key: Google Places API key
         cities: List of city dictionaries with lat/lon
         target_per_city: Target number of restaurants per city
         fetch_websites: Whether to fetch website URLs (additional API calls)
+        max_workers: Maximum number of concurrent city fetches
 
     Returns:
         List of all restaurant dictionaries
     """
     all_restaurants = []
 
-    for city in cities:
-        print(f"Fetching restaurants for {city['name']}...")
-
-        restaurants = search_restaurants(
-            api_key,
-            city["lat"],
-            city["lon"],
-            max_results=target_per_city,
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(cities) or 1)) as executor:
+        results = executor.map(
+            lambda city: fetch_city_restaurants(
+                api_key, city, target_per_city, fetch_websites
+            ),
+            cities,
         )
-
-        for restaurant in restaurants:
-            restaurant["city"] = city["name"]
-
-            if fetch_websites and restaurant.get("place_id"):
-                website = get_restaurant_website(api_key, restaurant["place_id"])
-                restaurant["website"] = website
-
-        print(f"  Found {len(restaurants)} restaurants")
-        all_restaurants.extend(restaurants)
+        for city, restaurants in zip(cities, results):
+            print(f"  {city['name']}: {len(restaurants)} restaurants")
+            all_restaurants.extend(restaurants)
 
     return all_restaurants
 
@@ -228,6 +368,11 @@ def main():
         action="store_true",
         help="Show what would be fetched without making API calls",
     )
+    parser.add_argument(
+        "--force-refresh",
+        action="store_true",
+        help="Bypass the on-disk Places API response cache",
+    )
     parser.add_argument(
         "--no-websites",
         action="store_true",
@@ -239,6 +384,12 @@ def main():
         default=15,
         help="Target number of restaurants per city (default: 15)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Maximum number of concurrent city fetches (default: 8)",
+    )
     parser.add_argument(
         "--output",
         type=Path,
@@ -247,17 +398,23 @@ def main():
     )
     args = parser.parse_args()
 
+    if args.force_refresh:
+        global _force_refresh
+        _force_refresh = True
+
     # Load cities
     script_dir = Path(__file__).parent.parent
     cities_path = script_dir / "data" / "cities.json"
     cities = load_cities(cities_path)
 
-    # Filter to specific city if requested
+    # Filter to specific city if requested (one dict lookup, no scan)
     if args.city:
-        cities = [c for c in cities if c["name"].lower() == args.city.lower()]
-        if not cities:
+        cities_by_name = {c["name"].lower(): c for c in cities}
+        city = cities_by_name.get(args.city.lower())
+        if city is None:
             print(f"Error: City '{args.city}' not found in cities.json")
             sys.exit(1)
+        cities = [city]
 
     if args.dry_run:
         print("Dry run - would fetch restaurants for:")
@@ -276,6 +433,7 @@ def main():
         cities,
         target_per_city=args.target,
         fetch_websites=not args.no_websites,
+        max_workers=args.workers,
     )
 
     # Save results
@@ -285,8 +443,11 @@ def main():
         "restaurants": restaurants,
     }
 
-    with open(output_path, "w") as f:
-        json.dump(output_data, f, indent=2)
+    if HAS_ORJSON:
+        output_path.write_bytes(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, "w") as f:
+            json.dump(output_data, f, indent=2)
 
     print(f"\nSaved {len(restaurants)} restaurants to {output_path}")
 
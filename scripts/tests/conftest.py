@@ -3,77 +3,241 @@ Pytest configuration and fixtures for Poutine Index tests.
 """
 
 import json
+import math
 from pathlib import Path
 
+import numpy as np
 import pytest
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
-@pytest.fixture
+
+def load_json(path: Path) -> dict:
+    """Load a JSON file, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
 def project_root() -> Path:
     """Return the project root directory."""
     return Path(__file__).parent.parent.parent
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def data_dir(project_root: Path) -> Path:
     """Return the data directory."""
     return project_root / "data"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def schemas_dir(project_root: Path) -> Path:
     """Return the schemas directory."""
     return project_root / "schemas"
 
 
-@pytest.fixture
-def cities_data(data_dir: Path) -> dict:
+@pytest.fixture(scope="session")
+def parsed_data_files(data_dir: Path) -> dict:
+    """
+    Parse every data/*.json exactly once per session.
+
+    Returns {"parsed": {filename: data}, "errors": {filename: message}}.
+    The data fixtures below and the JSON-validity test all read from
+    this one pass instead of re-parsing the same files.
+    """
+    parsed: dict = {}
+    errors: dict = {}
+    for json_file in sorted(data_dir.glob("*.json")):
+        try:
+            parsed[json_file.name] = load_json(json_file)
+        except ValueError as e:  # orjson.JSONDecodeError subclasses this
+            errors[json_file.name] = str(e)
+    return {"parsed": parsed, "errors": errors}
+
+
+@pytest.fixture(scope="session")
+def cities_data(parsed_data_files: dict) -> dict:
     """Load cities.json data."""
-    with open(data_dir / "cities.json") as f:
-        return json.load(f)
+    return parsed_data_files["parsed"]["cities.json"]
 
 
-@pytest.fixture
-def minimum_wages_data(data_dir: Path) -> dict:
+@pytest.fixture(scope="session")
+def minimum_wages_data(parsed_data_files: dict) -> dict:
     """Load minimum_wages.json data."""
-    with open(data_dir / "minimum_wages.json") as f:
-        return json.load(f)
+    return parsed_data_files["parsed"]["minimum_wages.json"]
 
 
-@pytest.fixture
-def cities_final_data(data_dir: Path) -> dict:
+@pytest.fixture(scope="session")
+def cities_final_data(parsed_data_files: dict) -> dict:
     """Load cities_final.json data."""
-    with open(data_dir / "cities_final.json") as f:
-        return json.load(f)
+    return parsed_data_files["parsed"]["cities_final.json"]
 
 
-@pytest.fixture
-def restaurants_raw_data(data_dir: Path) -> dict:
+@pytest.fixture(scope="session")
+def restaurants_raw_data(parsed_data_files: dict) -> dict:
     """Load restaurants_raw.json data if it exists."""
-    path = data_dir / "restaurants_raw.json"
-    if not path.exists():
-        return {"fetch_date": None, "restaurants": []}
-    with open(path) as f:
-        return json.load(f)
+    default = {"fetch_date": None, "restaurants": []}
+    return parsed_data_files["parsed"].get("restaurants_raw.json", default)
 
 
-@pytest.fixture
-def prices_raw_data(data_dir: Path) -> dict:
+@pytest.fixture(scope="session")
+def prices_raw_data(parsed_data_files: dict) -> dict:
     """Load prices_raw.json data if it exists."""
-    path = data_dir / "prices_raw.json"
-    if not path.exists():
-        return {"prices": []}
-    with open(path) as f:
-        return json.load(f)
+    return parsed_data_files["parsed"].get("prices_raw.json", {"prices": []})
+
+
+@pytest.fixture(scope="session")
+def price_arrays(prices_raw_data: dict) -> dict:
+    """
+    Flatten prices_raw entries into parallel arrays (NaN = missing
+    price), built once per session for vectorized price checks.
+    """
+    entries = prices_raw_data.get("prices", [])
+
+    def column(size: str) -> np.ndarray:
+        return np.array(
+            [
+                math.nan if (value := e.get("prices", {}).get(size)) is None else float(value)
+                for e in entries
+            ],
+            dtype=np.float64,
+        )
+
+    all_prices: list[float] = []
+    labels: list[str] = []
+    for e in entries:
+        name = e.get("restaurant_name", "Unknown")
+        for size, value in e.get("prices", {}).items():
+            if value is not None:
+                all_prices.append(float(value))
+                labels.append(f"{size} at {name}")
+
+    return {
+        "restaurants": np.array([e.get("restaurant_name", "Unknown") for e in entries]),
+        "cities": np.array([e.get("city", "Unknown") for e in entries]),
+        "small": column("small"),
+        "regular": column("regular"),
+        "large": column("large"),
+        "all_prices": np.array(all_prices, dtype=np.float64),
+        "labels": labels,
+    }
+
+
+@pytest.fixture(scope="session")
+def blocklist_matcher(fast_food_blocklist: set):
+    """
+    Return a callable that maps a lowercased name to the blocked chain
+    it contains, or None. Compiled once per session: an Aho-Corasick
+    automaton when pyahocorasick is installed, otherwise a single regex
+    alternation — either way one scan per name instead of one per chain.
+    """
+    try:
+        import ahocorasick
+    except ImportError:
+        import re
+
+        pattern = re.compile(
+            "|".join(sorted(map(re.escape, fast_food_blocklist), key=len, reverse=True))
+        )
+
+        def match(name: str):
+            hit = pattern.search(name)
+            return hit.group(0) if hit else None
+
+        return match
+
+    automaton = ahocorasick.Automaton()
+    for chain in fast_food_blocklist:
+        automaton.add_word(chain, chain)
+    automaton.make_automaton()
+
+    def match(name: str):
+        for _, chain in automaton.iter(name):
+            return chain
+        return None
+
+    return match
+
+
+@pytest.fixture(scope="session")
+def city_coord_map(cities_data: dict) -> dict:
+    """Map of target city name -> (lat, lon), built once per session."""
+    return {c["name"]: (c["lat"], c["lon"]) for c in cities_data["cities"]}
+
+
+@pytest.fixture(scope="session")
+def target_city_names(cities_data: dict) -> frozenset:
+    """Set of target city names, built once per session."""
+    return frozenset(c["name"] for c in cities_data["cities"])
+
+
+# Numeric columns extracted by the cities_frame fixture
+CITY_NUMERIC_FIELDS = ("lat", "lon", "sample_size", "minimum_wage", "affordability_index")
+PRICE_SIZES = ("small", "regular", "large")
+PRICE_STATS = ("mean", "median", "min", "max")
+
+
+@pytest.fixture(scope="session")
+def cities_frame(cities_final_data: dict) -> dict:
+    """
+    Flatten cities_final.json into column arrays for vectorized checks.
+
+    Returns a dict with:
+    - "names": array of city names (row order)
+    - "provinces": object array of province codes (None when missing)
+    - "columns": {field: float64 array}, NaN marking missing values
+    - "nan_fields": labels of values that were literally NaN in the data
+    """
+    cities = cities_final_data["cities"]
+    columns: dict = {}
+    nan_fields: list[str] = []
+
+    def cell(value, label: str) -> float:
+        if value is None:
+            return math.nan
+        value = float(value)
+        if math.isnan(value):
+            nan_fields.append(label)
+        return value
+
+    for field in CITY_NUMERIC_FIELDS:
+        columns[field] = np.array(
+            [cell(c.get(field), f"{c['name']}.{field}") for c in cities]
+        )
+
+    for size in PRICE_SIZES:
+        for stat in PRICE_STATS:
+            columns[f"prices_{size}_{stat}"] = np.array(
+                [
+                    cell(
+                        (c.get("prices", {}).get(size) or {}).get(stat),
+                        f"{c['name']}.prices.{size}.{stat}",
+                    )
+                    for c in cities
+                ]
+            )
+
+    return {
+        "names": np.array([c["name"] for c in cities]),
+        "provinces": np.array([c.get("province") for c in cities], dtype=object),
+        "columns": columns,
+        "nan_fields": nan_fields,
+    }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_province_codes() -> set:
     """Return set of valid Canadian province/territory codes."""
     return {"AB", "BC", "MB", "NB", "NL", "NS", "NT", "NU", "ON", "PE", "QC", "SK", "YT"}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fast_food_blocklist() -> set:
     """Return set of blocked fast food chain names (lowercase)."""
     return {
@@ -110,7 +274,7 @@ CANADA_LON_MIN = -141.0
 CANADA_LON_MAX = -52.0
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def canada_bounds() -> dict:
     """Return Canada's geographic bounding box."""
     return {
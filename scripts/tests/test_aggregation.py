@@ -9,10 +9,7 @@ These tests validate:
 - Sample size matches actual count of validated restaurants
 """
 
-import json
-import math
-from pathlib import Path
-
+import numpy as np
 import pytest
 
 
@@ -40,34 +37,30 @@ class TestCityCoverage:
 class TestAffordabilityIndex:
     """Tests for affordability index validity."""
 
-    def test_affordability_positive(self, cities_final_data: dict):
+    def test_affordability_positive(self, cities_frame: dict):
         """Verify affordability index is non-negative."""
-        negative = []
-
-        for city in cities_final_data["cities"]:
-            index = city.get("affordability_index")
-            if index is not None and index < 0:
-                negative.append(f"{city['name']}: {index}")
+        index = cities_frame["columns"]["affordability_index"]
+        bad = index < 0  # NaN compares False, so missing values pass
 
-        assert not negative, f"Negative affordability indices: {'; '.join(negative)}"
+        assert not bad.any(), (
+            f"Negative affordability indices: "
+            f"{'; '.join(cities_frame['names'][bad])}"
+        )
 
-    def test_affordability_reasonable_range(self, cities_final_data: dict):
+    def test_affordability_reasonable_range(self, cities_frame: dict):
         """Verify affordability index is within reasonable range (1-60 min)."""
-        out_of_range = []
-
-        for city in cities_final_data["cities"]:
-            index = city.get("affordability_index")
-            sample_size = city.get("sample_size", 0)
-
-            # Skip cities with no data
-            if sample_size == 0:
-                continue
-
-            if index is not None:
-                if index < MIN_AFFORDABILITY or index > MAX_AFFORDABILITY:
-                    out_of_range.append(f"{city['name']}: {index:.1f} min")
-
-        if out_of_range:
+        columns = cities_frame["columns"]
+        index = columns["affordability_index"]
+
+        # Skip cities with no data or no index
+        checked = (columns["sample_size"] > 0) & ~np.isnan(index)
+        bad = checked & ((index < MIN_AFFORDABILITY) | (index > MAX_AFFORDABILITY))
+
+        if bad.any():
+            out_of_range = [
+                f"{name}: {value:.1f} min"
+                for name, value in zip(cities_frame["names"][bad], index[bad])
+            ]
             pytest.fail(
                 f"Affordability indices outside {MIN_AFFORDABILITY}-{MAX_AFFORDABILITY} range: "
                 f"{'; '.join(out_of_range)}"
@@ -117,52 +110,30 @@ class TestMinimumWageData:
 class TestNumericFieldValidity:
     """Tests for numeric field validity."""
 
-    def test_no_nan_values(self, cities_final_data: dict):
+    def test_no_nan_values(self, cities_frame: dict):
         """Verify no NaN values in numeric fields."""
-        nan_found = []
-
-        for city in cities_final_data["cities"]:
-            # Check top-level numeric fields
-            for field in ["lat", "lon", "sample_size", "minimum_wage", "affordability_index"]:
-                value = city.get(field)
-                if value is not None and isinstance(value, float) and math.isnan(value):
-                    nan_found.append(f"{city['name']}.{field}")
-
-            # Check price statistics
-            for size in ["small", "regular", "large"]:
-                price_stats = city.get("prices", {}).get(size)
-                if price_stats is None:
-                    continue
-                for stat in ["mean", "median", "min", "max"]:
-                    value = price_stats.get(stat)
-                    if value is not None and isinstance(value, float) and math.isnan(value):
-                        nan_found.append(f"{city['name']}.prices.{size}.{stat}")
-
+        # The fixture records every literal NaN it saw while flattening
+        nan_found = cities_frame["nan_fields"]
         assert not nan_found, f"NaN values found: {', '.join(nan_found)}"
 
-    def test_no_negative_values(self, cities_final_data: dict):
+    def test_no_negative_values(self, cities_frame: dict):
         """Verify no negative values in numeric fields that should be positive."""
+        columns = cities_frame["columns"]
+        names = cities_frame["names"]
         negative_found = []
 
-        for city in cities_final_data["cities"]:
-            # Check fields that must be non-negative
-            non_negative_fields = ["sample_size", "minimum_wage", "affordability_index"]
-            for field in non_negative_fields:
-                value = city.get(field)
-                if value is not None and value < 0:
-                    negative_found.append(f"{city['name']}.{field}: {value}")
-
-            # Check price statistics
-            for size in ["small", "regular", "large"]:
-                price_stats = city.get("prices", {}).get(size)
-                if price_stats is None:
-                    continue
-                for stat in ["mean", "median", "min", "max"]:
-                    value = price_stats.get(stat)
-                    if value is not None and value < 0:
-                        negative_found.append(
-                            f"{city['name']}.prices.{size}.{stat}: {value}"
-                        )
+        non_negative_fields = ["sample_size", "minimum_wage", "affordability_index"] + [
+            f"prices_{size}_{stat}"
+            for size in ["small", "regular", "large"]
+            for stat in ["mean", "median", "min", "max"]
+        ]
+        for field in non_negative_fields:
+            values = columns[field]
+            bad = values < 0  # NaN compares False
+            negative_found.extend(
+                f"{name}.{field}: {value}"
+                for name, value in zip(names[bad], values[bad])
+            )
 
         assert not negative_found, f"Negative values found: {', '.join(negative_found)}"
 
@@ -181,52 +152,46 @@ class TestNumericFieldValidity:
 class TestDataConsistency:
     """Tests for data consistency."""
 
-    def test_price_stats_min_max_order(self, cities_final_data: dict):
+    def test_price_stats_min_max_order(self, cities_frame: dict):
         """Verify min <= mean <= max for all price statistics."""
+        columns = cities_frame["columns"]
+        names = cities_frame["names"]
         violations = []
 
-        for city in cities_final_data["cities"]:
-            for size in ["small", "regular", "large"]:
-                stats = city.get("prices", {}).get(size)
-                if stats is None:
-                    continue
-
-                min_val = stats.get("min")
-                mean_val = stats.get("mean")
-                max_val = stats.get("max")
-
-                if None in (min_val, mean_val, max_val):
-                    continue
-
-                if not (min_val <= mean_val <= max_val):
-                    violations.append(
-                        f"{city['name']} {size}: "
-                        f"min={min_val}, mean={mean_val}, max={max_val}"
-                    )
+        for size in ["small", "regular", "large"]:
+            min_val = columns[f"prices_{size}_min"]
+            mean_val = columns[f"prices_{size}_mean"]
+            max_val = columns[f"prices_{size}_max"]
+
+            present = ~(np.isnan(min_val) | np.isnan(mean_val) | np.isnan(max_val))
+            bad = present & ((min_val > mean_val) | (mean_val > max_val))
+            violations.extend(
+                f"{name} {size}: min={mn}, mean={me}, max={mx}"
+                for name, mn, me, mx in zip(
+                    names[bad], min_val[bad], mean_val[bad], max_val[bad]
+                )
+            )
 
         assert not violations, f"Price stat order violations: {'; '.join(violations)}"
 
-    def test_price_stats_median_in_range(self, cities_final_data: dict):
+    def test_price_stats_median_in_range(self, cities_frame: dict):
         """Verify median is between min and max."""
+        columns = cities_frame["columns"]
+        names = cities_frame["names"]
         violations = []
 
-        for city in cities_final_data["cities"]:
-            for size in ["small", "regular", "large"]:
-                stats = city.get("prices", {}).get(size)
-                if stats is None:
-                    continue
-
-                min_val = stats.get("min")
-                median_val = stats.get("median")
-                max_val = stats.get("max")
-
-                if None in (min_val, median_val, max_val):
-                    continue
-
-                if not (min_val <= median_val <= max_val):
-                    violations.append(
-                        f"{city['name']} {size}: "
-                        f"median={median_val} not in [{min_val}, {max_val}]"
-                    )
+        for size in ["small", "regular", "large"]:
+            min_val = columns[f"prices_{size}_min"]
+            median_val = columns[f"prices_{size}_median"]
+            max_val = columns[f"prices_{size}_max"]
+
+            present = ~(np.isnan(min_val) | np.isnan(median_val) | np.isnan(max_val))
+            bad = present & ((median_val < min_val) | (median_val > max_val))
+            violations.extend(
+                f"{name} {size}: median={md} not in [{mn}, {mx}]"
+                for name, md, mn, mx in zip(
+                    names[bad], median_val[bad], min_val[bad], max_val[bad]
+                )
+            )
 
         assert not violations, f"Median range violations: {'; '.join(violations)}"
@@ -11,32 +11,70 @@ These tests validate:
 """
 
 import json
-from datetime import datetime
+import re
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
 
+import numpy as np
 import pytest
 
+# Semver X.Y.Z, compiled once at import
+_SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+$")
+
 try:
     import jsonschema
     HAS_JSONSCHEMA = True
 except ImportError:
     HAS_JSONSCHEMA = False
 
+try:
+    import fastjsonschema
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
+
+@lru_cache(maxsize=None)
+def _get_validator(schema_path: str):
+    """Load and compile a schema once; jsonschema.validate re-compiles
+    (and re-meta-validates) the schema on every call."""
+    with open(schema_path) as f:
+        schema = json.load(f)
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
+@lru_cache(maxsize=None)
+def _compiled(schema_path: str):
+    """Compile a schema to a fastjsonschema callable (code generation,
+    orders of magnitude faster than walking the schema per instance)."""
+    with open(schema_path) as f:
+        return fastjsonschema.compile(json.load(f))
+
+
+def _validate_against_schema(data: dict, schema_path: Path) -> None:
+    """Validate data, preferring fastjsonschema when installed."""
+    if HAS_FASTJSONSCHEMA:
+        try:
+            _compiled(str(schema_path))(data)
+        except fastjsonschema.JsonSchemaException as e:
+            raise AssertionError(f"{schema_path.name}: {e.message}") from e
+    else:
+        # Raises ValidationError if invalid
+        _get_validator(str(schema_path)).validate(data)
+
 
 class TestJsonValidity:
     """Tests for JSON file validity."""
 
-    def test_all_json_files_valid(self, data_dir: Path):
+    def test_all_json_files_valid(self, parsed_data_files: dict):
         """Verify all JSON files in data/ are parseable."""
-        invalid = []
-
-        for json_file in data_dir.glob("*.json"):
-            try:
-                with open(json_file) as f:
-                    json.load(f)
-            except json.JSONDecodeError as e:
-                invalid.append(f"{json_file.name}: {e}")
-
+        invalid = [
+            f"{name}: {message}"
+            for name, message in parsed_data_files["errors"].items()
+        ]
         assert not invalid, f"Invalid JSON files: {'; '.join(invalid)}"
 
 
@@ -53,11 +91,7 @@ class TestSchemaValidation:
         with open(data_dir / "cities_final.json") as f:
             data = json.load(f)
 
-        with open(schemas_dir / "city_final.schema.json") as f:
-            schema = json.load(f)
-
-        # This will raise ValidationError if invalid
-        jsonschema.validate(data, schema)
+        _validate_against_schema(data, schemas_dir / "city_final.schema.json")
 
     def test_minimum_wages_validates_against_schema(
         self,
@@ -68,10 +102,7 @@ class TestSchemaValidation:
         with open(data_dir / "minimum_wages.json") as f:
             data = json.load(f)
 
-        with open(schemas_dir / "minimum_wage.schema.json") as f:
-            schema = json.load(f)
-
-        jsonschema.validate(data, schema)
+        _validate_against_schema(data, schemas_dir / "minimum_wage.schema.json")
 
 
 class TestCoordinateValidity:
@@ -79,32 +110,29 @@ class TestCoordinateValidity:
 
     def test_city_coordinates_within_canada(
         self,
-        cities_final_data: dict,
+        cities_frame: dict,
         canada_bounds: dict,
     ):
         """Verify all city coordinates are within Canada's bounding box."""
-        out_of_bounds = []
-
-        for city in cities_final_data["cities"]:
-            lat = city.get("lat")
-            lon = city.get("lon")
-
-            if lat is None or lon is None:
-                out_of_bounds.append(f"{city['name']}: missing coordinates")
-                continue
-
-            if not (canada_bounds["lat_min"] <= lat <= canada_bounds["lat_max"]):
-                out_of_bounds.append(
-                    f"{city['name']}: latitude {lat} out of bounds "
-                    f"[{canada_bounds['lat_min']}, {canada_bounds['lat_max']}]"
-                )
-
-            if not (canada_bounds["lon_min"] <= lon <= canada_bounds["lon_max"]):
-                out_of_bounds.append(
-                    f"{city['name']}: longitude {lon} out of bounds "
-                    f"[{canada_bounds['lon_min']}, {canada_bounds['lon_max']}]"
-                )
+        lats = cities_frame["columns"]["lat"]
+        lons = cities_frame["columns"]["lon"]
+        names = cities_frame["names"]
+
+        missing = np.isnan(lats) | np.isnan(lons)
+        bad = (
+            missing
+            | (lats < canada_bounds["lat_min"])
+            | (lats > canada_bounds["lat_max"])
+            | (lons < canada_bounds["lon_min"])
+            | (lons > canada_bounds["lon_max"])
+        )
 
+        out_of_bounds = [
+            f"{names[i]}: missing coordinates"
+            if missing[i]
+            else f"{names[i]}: lat={lats[i]}, lon={lons[i]} out of bounds"
+            for i in np.flatnonzero(bad)
+        ]
         assert not out_of_bounds, f"Coordinates out of bounds: {'; '.join(out_of_bounds)}"
 
 
@@ -113,18 +141,24 @@ class TestProvinceValidity:
 
     def test_all_province_codes_valid(
         self,
-        cities_final_data: dict,
+        cities_frame: dict,
         valid_province_codes: set,
     ):
         """Verify all province codes are valid Canadian codes."""
-        invalid = []
+        provinces = cities_frame["provinces"]
 
-        for city in cities_final_data["cities"]:
-            province = city.get("province")
-            if province not in valid_province_codes:
-                invalid.append(f"{city['name']}: '{province}'")
+        # Fast path: one set difference; build per-city detail only on failure
+        bad_provinces = set(provinces.tolist()) - valid_province_codes
+        if not bad_provinces:
+            return
 
-        assert not invalid, f"Invalid province codes: {', '.join(invalid)}"
+        names = cities_frame["names"]
+        invalid = [
+            f"{names[i]}: '{provinces[i]}'"
+            for i in range(len(provinces))
+            if provinces[i] in bad_provinces
+        ]
+        pytest.fail(f"Invalid province codes: {', '.join(invalid)}")
 
 
 class TestDateValidity:
@@ -137,11 +171,11 @@ class TestDateValidity:
             pytest.skip("No last_updated field")
 
         try:
-            update_date = datetime.strptime(last_updated, "%Y-%m-%d")
+            update_date = date.fromisoformat(last_updated)
         except ValueError:
             pytest.fail(f"Invalid date format: {last_updated}")
 
-        assert update_date <= datetime.now(), (
+        assert update_date <= date.today(), (
             f"last_updated date is in the future: {last_updated}"
         )
 
@@ -152,7 +186,7 @@ class TestDateValidity:
             pytest.skip("No last_updated field")
 
         try:
-            datetime.strptime(last_updated, "%Y-%m-%d")
+            date.fromisoformat(last_updated)
         except ValueError:
             pytest.fail(f"Invalid date format (expected YYYY-MM-DD): {last_updated}")
 
@@ -162,18 +196,19 @@ class TestDataReferences:
 
     def test_cities_reference_valid_provinces(
         self,
-        cities_final_data: dict,
+        cities_frame: dict,
         minimum_wages_data: dict,
     ):
         """Verify all cities reference provinces with wage data."""
-        available_provinces = set(minimum_wages_data["wages"].keys())
-        missing_references = []
+        provinces = cities_frame["provinces"]
+        names = cities_frame["names"]
 
-        for city in cities_final_data["cities"]:
-            province = city.get("province")
-            if province and province not in available_provinces:
-                missing_references.append(f"{city['name']} -> {province}")
+        known = np.isin(provinces, list(minimum_wages_data["wages"]))
+        missing = (provinces != None) & ~known  # noqa: E711 (elementwise)
 
+        missing_references = [
+            f"{names[i]} -> {provinces[i]}" for i in np.flatnonzero(missing)
+        ]
         assert not missing_references, (
             f"Cities reference missing provinces: {', '.join(missing_references)}"
         )
@@ -181,10 +216,10 @@ class TestDataReferences:
     def test_no_orphaned_restaurant_cities(
         self,
         restaurants_raw_data: dict,
-        cities_data: dict,
+        target_city_names: frozenset,
     ):
         """Verify all restaurants reference valid target cities."""
-        target_cities = {c["name"] for c in cities_data["cities"]}
+        target_cities = target_city_names
         orphaned = []
 
         for restaurant in restaurants_raw_data.get("restaurants", []):
@@ -207,8 +242,6 @@ class TestDataVersioning:
         if version is None:
             pytest.skip("No data_version field")
 
-        import re
-        semver_pattern = r"^\d+\.\d+\.\d+$"
-        assert re.match(semver_pattern, version), (
+        assert _SEMVER_RE.match(version), (
             f"Invalid version format (expected X.Y.Z): {version}"
         )
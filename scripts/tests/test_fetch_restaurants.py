@@ -12,6 +12,9 @@ These tests validate:
 import json
 from pathlib import Path
 
+from collections import Counter, defaultdict
+
+import numpy as np
 import pytest
 
 
@@ -42,16 +45,17 @@ class TestFastFoodFiltering:
     def test_no_fast_food_chains(
         self,
         restaurants_raw_data: dict,
-        fast_food_blocklist: set,
+        blocklist_matcher,
     ):
         """Verify no fast food chains in restaurant list."""
+        found = []
+
         for restaurant in restaurants_raw_data["restaurants"]:
-            name_lower = restaurant["name"].lower()
-            for blocked in fast_food_blocklist:
-                assert blocked not in name_lower, (
-                    f"Fast food chain found: {restaurant['name']} "
-                    f"(matched '{blocked}')"
-                )
+            blocked = blocklist_matcher(restaurant["name"].lower())
+            if blocked:
+                found.append(f"{restaurant['name']} (matched '{blocked}')")
+
+        assert not found, f"Fast food chains found: {'; '.join(found)}"
 
 
 class TestCoordinateValidation:
@@ -63,63 +67,67 @@ class TestCoordinateValidation:
         canada_bounds: dict,
     ):
         """Verify all restaurant coordinates are within Canada."""
-        for restaurant in restaurants_raw_data["restaurants"]:
-            if "lat" not in restaurant or "lon" not in restaurant:
-                continue
-
-            lat = restaurant["lat"]
-            lon = restaurant["lon"]
-
-            assert canada_bounds["lat_min"] <= lat <= canada_bounds["lat_max"], (
-                f"Latitude {lat} out of Canada bounds for {restaurant['name']}"
-            )
-            assert canada_bounds["lon_min"] <= lon <= canada_bounds["lon_max"], (
-                f"Longitude {lon} out of Canada bounds for {restaurant['name']}"
-            )
+        with_coords = [
+            r
+            for r in restaurants_raw_data["restaurants"]
+            if "lat" in r and "lon" in r
+        ]
+        lats = np.array([r["lat"] for r in with_coords], dtype=np.float64)
+        lons = np.array([r["lon"] for r in with_coords], dtype=np.float64)
+
+        bad = (
+            (lats < canada_bounds["lat_min"])
+            | (lats > canada_bounds["lat_max"])
+            | (lons < canada_bounds["lon_min"])
+            | (lons > canada_bounds["lon_max"])
+        )
+
+        out_of_bounds = [
+            f"{with_coords[i]['name']}: lat={lats[i]}, lon={lons[i]}"
+            for i in np.flatnonzero(bad)
+        ]
+        assert not out_of_bounds, (
+            f"Coordinates out of Canada bounds: {'; '.join(out_of_bounds)}"
+        )
 
     def test_coordinates_near_city(
         self,
         restaurants_raw_data: dict,
-        cities_data: dict,
+        city_coord_map: dict,
     ):
         """Verify restaurant coordinates are within 50km of target city center."""
-        import math
-
-        def haversine_km(lat1, lon1, lat2, lon2):
-            """Calculate distance between two points in kilometers."""
-            R = 6371  # Earth's radius in km
-            dlat = math.radians(lat2 - lat1)
-            dlon = math.radians(lon2 - lon1)
-            a = (
-                math.sin(dlat / 2) ** 2
-                + math.cos(math.radians(lat1))
-                * math.cos(math.radians(lat2))
-                * math.sin(dlon / 2) ** 2
-            )
-            c = 2 * math.asin(math.sqrt(a))
-            return R * c
-
-        # Build city lookup
-        city_coords = {c["name"]: (c["lat"], c["lon"]) for c in cities_data["cities"]}
-
-        for restaurant in restaurants_raw_data["restaurants"]:
-            if "lat" not in restaurant or "lon" not in restaurant:
-                continue
-
-            city = restaurant.get("city")
-            if city not in city_coords:
-                continue
-
-            city_lat, city_lon = city_coords[city]
-            distance = haversine_km(
-                city_lat, city_lon,
-                restaurant["lat"], restaurant["lon"]
-            )
-
-            assert distance <= 50, (
-                f"Restaurant {restaurant['name']} is {distance:.1f}km "
-                f"from {city} center (max 50km)"
-            )
+        city_coords = city_coord_map
+
+        # Gather coordinate pairs once (SoA), then run one vectorized
+        # haversine pass instead of per-restaurant scalar trig
+        checked = [
+            r
+            for r in restaurants_raw_data["restaurants"]
+            if "lat" in r and "lon" in r and r.get("city") in city_coords
+        ]
+        if not checked:
+            return
+
+        rlat = np.radians(np.array([r["lat"] for r in checked], dtype=np.float64))
+        rlon = np.radians(np.array([r["lon"] for r in checked], dtype=np.float64))
+        clat = np.radians(
+            np.array([city_coords[r["city"]][0] for r in checked], dtype=np.float64)
+        )
+        clon = np.radians(
+            np.array([city_coords[r["city"]][1] for r in checked], dtype=np.float64)
+        )
+
+        dlat = rlat - clat
+        dlon = rlon - clon
+        a = np.sin(dlat / 2) ** 2 + np.cos(clat) * np.cos(rlat) * np.sin(dlon / 2) ** 2
+        distances = 2 * 6371 * np.arcsin(np.sqrt(a))  # Earth radius in km
+
+        too_far = [
+            f"{checked[i]['name']} is {distances[i]:.1f}km "
+            f"from {checked[i]['city']} center"
+            for i in np.flatnonzero(distances > 50)
+        ]
+        assert not too_far, f"Restaurants too far from city (max 50km): {'; '.join(too_far)}"
 
 
 class TestRestaurantCoverage:
@@ -153,19 +161,18 @@ class TestDuplicates:
 
     def test_no_duplicate_place_ids_within_city(self, restaurants_raw_data: dict):
         """Verify no duplicate Place IDs within the same city."""
-        city_place_ids: dict[str, set] = {}
+        by_city: dict[str, list] = defaultdict(list)
 
         for restaurant in restaurants_raw_data["restaurants"]:
-            city = restaurant.get("city", "Unknown")
             place_id = restaurant.get("place_id")
-
-            if not place_id:
-                continue
-
-            if city not in city_place_ids:
-                city_place_ids[city] = set()
-
-            assert place_id not in city_place_ids[city], (
-                f"Duplicate Place ID {place_id} in {city}"
-            )
-            city_place_ids[city].add(place_id)
+            if place_id:
+                by_city[restaurant.get("city", "Unknown")].append(place_id)
+
+        duplicates = [
+            f"{place_id} in {city} (x{count})"
+            for city, place_ids in by_city.items()
+            if len(place_ids) != len(set(place_ids))
+            for place_id, count in Counter(place_ids).items()
+            if count > 1
+        ]
+        assert not duplicates, f"Duplicate Place IDs: {'; '.join(duplicates)}"
@@ -11,7 +11,6 @@ These tests validate:
 - Page is responsive (375px and 1200px widths)
 """
 
-import json
 from pathlib import Path
 
 import pytest
@@ -19,6 +18,7 @@ import pytest
 # Try to import playwright, skip tests if not available
 try:
     from playwright.sync_api import sync_playwright, Page, Browser
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
     HAS_PLAYWRIGHT = True
 except ImportError:
     HAS_PLAYWRIGHT = False
@@ -26,10 +26,22 @@ except ImportError:
 
 pytestmark = pytest.mark.skipif(not HAS_PLAYWRIGHT, reason="Playwright not installed")
 
+# Condition-driven waits: return as soon as Leaflet has rendered,
+# instead of sleeping a fixed amount per test
+MARKERS_PRESENT_JS = "document.querySelectorAll('.leaflet-interactive').length > 0"
+MAP_HAS_SIZE_JS = (
+    "(() => { const el = document.getElementById('map');"
+    " if (!el) return false;"
+    " const r = el.getBoundingClientRect();"
+    " return r.width > 0 && r.height > 0; })()"
+)
 
-@pytest.fixture(scope="module")
+
+@pytest.fixture(scope="session")
 def browser():
-    """Create a browser instance for the test module."""
+    """Create one browser instance for the whole test session.
+
+    Contexts are cheap to create per test; browser launches are not."""
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
         yield browser
@@ -50,12 +62,10 @@ def page(browser: "Browser", project_root: Path) -> "Page":
     context.close()
 
 
-@pytest.fixture
-def cities_count(project_root: Path) -> int:
+@pytest.fixture(scope="session")
+def cities_count(cities_final_data: dict) -> int:
     """Get the expected number of city markers."""
-    with open(project_root / "data" / "cities_final.json") as f:
-        data = json.load(f)
-    return len(data["cities"])
+    return len(cities_final_data["cities"])
 
 
 class TestPageLoad:
@@ -76,12 +86,17 @@ class TestPageLoad:
 
         page.on("console", handle_console)
 
-        # Reload and wait for network idle
+        # Reload and wait until the map has rendered; any async data-load
+        # errors will have fired by then. If an error stops markers from
+        # rendering at all, report the captured errors rather than the
+        # wait timeout — they are the diagnosis.
         page.reload()
         page.wait_for_load_state("networkidle")
-
-        # Give some time for any async errors
-        page.wait_for_timeout(1000)
+        try:
+            page.wait_for_function(MARKERS_PRESENT_JS)
+        except PlaywrightTimeoutError:
+            assert not errors, f"Console errors found: {errors}"
+            raise
 
         assert not errors, f"Console errors found: {errors}"
 
@@ -97,7 +112,7 @@ class TestMapContainer:
     def test_map_has_dimensions(self, page: "Page"):
         """Verify map container has non-zero dimensions."""
         page.wait_for_selector("#map")
-        page.wait_for_timeout(1000)  # Wait for Leaflet to initialize
+        page.wait_for_function(MAP_HAS_SIZE_JS)  # Leaflet initialized
 
         box = page.locator("#map").bounding_box()
         assert box is not None, "Could not get map bounding box"
@@ -111,11 +126,13 @@ class TestMapMarkers:
     def test_markers_rendered(self, page: "Page", cities_count: int):
         """Verify correct number of markers are rendered."""
         page.wait_for_selector("#map")
-        page.wait_for_timeout(2000)  # Wait for data load and marker rendering
+        page.wait_for_function(MARKERS_PRESENT_JS)  # Data loaded, markers rendered
 
-        # Leaflet circle markers have class 'leaflet-interactive'
-        markers = page.locator(".leaflet-interactive")
-        marker_count = markers.count()
+        # Leaflet circle markers have class 'leaflet-interactive';
+        # one evaluate round-trip instead of locator count + per-node calls
+        marker_count = page.evaluate(
+            "() => document.querySelectorAll('.leaflet-interactive').length"
+        )
 
         assert marker_count == cities_count, (
             f"Expected {cities_count} markers, found {marker_count}"
@@ -124,31 +141,32 @@ class TestMapMarkers:
     def test_marker_click_opens_popup(self, page: "Page"):
         """Verify clicking a marker opens a popup."""
         page.wait_for_selector("#map")
-        page.wait_for_timeout(2000)
+        page.wait_for_function(MARKERS_PRESENT_JS)
 
         # Click the first marker
         markers = page.locator(".leaflet-interactive")
         if markers.count() > 0:
             markers.first.click()
-            page.wait_for_timeout(500)
 
             # Check for popup
             popup = page.locator(".leaflet-popup-content")
+            popup.first.wait_for(state="attached")
             assert popup.count() > 0, "Popup did not open on marker click"
 
     def test_popup_has_expected_fields(self, page: "Page"):
         """Verify popup contains expected data fields."""
         page.wait_for_selector("#map")
-        page.wait_for_timeout(2000)
+        page.wait_for_function(MARKERS_PRESENT_JS)
 
         markers = page.locator(".leaflet-interactive")
         if markers.count() == 0:
             pytest.skip("No markers to test")
 
         markers.first.click()
-        page.wait_for_timeout(500)
+        popup = page.locator(".leaflet-popup-content")
+        popup.first.wait_for(state="attached")
 
-        popup_content = page.locator(".leaflet-popup-content").inner_text()
+        popup_content = popup.inner_text()
 
         # Check for expected content patterns
         assert "$" in popup_content, "No price information in popup"
@@ -177,7 +195,7 @@ class TestLegend:
     def test_legend_visible(self, page: "Page"):
         """Verify legend element is visible."""
         page.wait_for_selector("#map")
-        page.wait_for_timeout(1000)
+        page.wait_for_function(MARKERS_PRESENT_JS)  # Legend is added with the map
 
         legend = page.locator(".leaflet-legend")
         if legend.count() == 0:
@@ -248,8 +266,11 @@ class TestAccessibility:
 
     def test_images_have_alt_text(self, page: "Page"):
         """Verify images have alt attributes."""
-        images = page.locator("img")
-        for i in range(images.count()):
-            img = images.nth(i)
-            alt = img.get_attribute("alt")
-            assert alt is not None, f"Image missing alt attribute: {img.get_attribute('src')}"
+        # Each locator call is a CDP round-trip; fetch all alt/src pairs
+        # in one evaluate instead
+        images = page.evaluate(
+            "() => Array.from(document.images,"
+            " img => ({alt: img.getAttribute('alt'), src: img.getAttribute('src')}))"
+        )
+        missing = [img["src"] for img in images if img["alt"] is None]
+        assert not missing, f"Images missing alt attribute: {missing}"
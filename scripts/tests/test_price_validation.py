@@ -10,9 +10,9 @@ These tests validate:
 - Confidence field values
 """
 
-import json
-from pathlib import Path
+from collections import Counter
 
+import numpy as np
 import pytest
 
 
@@ -22,92 +22,70 @@ MAX_PRICE = 25.00
 
 VALID_CONFIDENCE = {"high", "medium", "low"}
 
+# Accepted source_url prefixes (single startswith call per entry)
+URL_PREFIXES = ("http://", "https://")
+
 
 class TestPriceSanity:
     """Tests for price sanity checks."""
 
-    def test_regular_price_within_bounds(self, prices_raw_data: dict):
+    def test_regular_price_within_bounds(self, price_arrays: dict):
         """Verify regular poutine prices are between $5-25 CAD."""
-        outliers = []
+        regular = price_arrays["regular"]
+        bad = (regular < MIN_PRICE) | (regular > MAX_PRICE)  # NaN compares False
 
-        for entry in prices_raw_data.get("prices", []):
-            regular = entry.get("prices", {}).get("regular")
-            if regular is None:
-                continue
-
-            if regular < MIN_PRICE or regular > MAX_PRICE:
-                outliers.append({
-                    "restaurant": entry.get("restaurant_name", "Unknown"),
-                    "city": entry.get("city", "Unknown"),
-                    "price": regular,
-                })
-
-        if outliers:
+        if bad.any():
             outlier_str = "; ".join(
-                f"{o['restaurant']} ({o['city']}): ${o['price']:.2f}"
-                for o in outliers
+                f"{restaurant} ({city}): ${price:.2f}"
+                for restaurant, city, price in zip(
+                    price_arrays["restaurants"][bad],
+                    price_arrays["cities"][bad],
+                    regular[bad],
+                )
             )
             pytest.fail(f"Price outliers found (should be ${MIN_PRICE}-${MAX_PRICE}): {outlier_str}")
 
-    def test_all_prices_positive(self, prices_raw_data: dict):
+    def test_all_prices_positive(self, price_arrays: dict):
         """Verify all prices are positive numbers."""
-        for entry in prices_raw_data.get("prices", []):
-            for size, price in entry.get("prices", {}).items():
-                if price is not None:
-                    assert price > 0, (
-                        f"Non-positive price for {size} at "
-                        f"{entry.get('restaurant_name', 'Unknown')}: {price}"
-                    )
+        all_prices = price_arrays["all_prices"]
+        bad = all_prices <= 0
+
+        assert not bad.any(), "Non-positive prices: " + "; ".join(
+            f"{price_arrays['labels'][i]}: {all_prices[i]}"
+            for i in np.flatnonzero(bad)
+        )
 
 
 class TestSizeLogic:
     """Tests for price size ordering."""
 
-    def test_small_less_than_regular(self, prices_raw_data: dict):
+    def test_small_less_than_regular(self, price_arrays: dict):
         """Verify small < regular when both exist."""
-        violations = []
+        small = price_arrays["small"]
+        regular = price_arrays["regular"]
+        bad = small >= regular  # NaN compares False, so missing pairs pass
 
-        for entry in prices_raw_data.get("prices", []):
-            prices = entry.get("prices", {})
-            small = prices.get("small")
-            regular = prices.get("regular")
-
-            if small is not None and regular is not None and small >= regular:
-                violations.append({
-                    "restaurant": entry.get("restaurant_name", "Unknown"),
-                    "city": entry.get("city", "Unknown"),
-                    "small": small,
-                    "regular": regular,
-                })
-
-        if violations:
+        if bad.any():
             violation_str = "; ".join(
-                f"{v['restaurant']}: small=${v['small']:.2f} >= regular=${v['regular']:.2f}"
-                for v in violations
+                f"{restaurant}: small=${s:.2f} >= regular=${r:.2f}"
+                for restaurant, s, r in zip(
+                    price_arrays["restaurants"][bad], small[bad], regular[bad]
+                )
             )
             pytest.fail(f"Size ordering violations: {violation_str}")
 
-    def test_regular_less_than_large(self, prices_raw_data: dict):
+    def test_regular_less_than_large(self, price_arrays: dict):
         """Verify regular < large when both exist."""
-        violations = []
+        regular = price_arrays["regular"]
+        large = price_arrays["large"]
+        bad = regular >= large
 
-        for entry in prices_raw_data.get("prices", []):
-            prices = entry.get("prices", {})
-            regular = prices.get("regular")
-            large = prices.get("large")
-
-            if regular is not None and large is not None and regular >= large:
-                violations.append({
-                    "restaurant": entry.get("restaurant_name", "Unknown"),
-                    "city": entry.get("city", "Unknown"),
-                    "regular": regular,
-                    "large": large,
-                })
-
-        if violations:
+        if bad.any():
             violation_str = "; ".join(
-                f"{v['restaurant']}: regular=${v['regular']:.2f} >= large=${v['large']:.2f}"
-                for v in violations
+                f"{restaurant}: regular=${r:.2f} >= large=${l:.2f}"
+                for restaurant, r, l in zip(
+                    price_arrays["restaurants"][bad], regular[bad], large[bad]
+                )
             )
             pytest.fail(f"Size ordering violations: {violation_str}")
 
@@ -117,20 +95,15 @@ class TestDuplicates:
 
     def test_no_duplicate_restaurants_per_city(self, prices_raw_data: dict):
         """Verify no duplicate restaurant entries within a city."""
-        seen: dict[str, set] = {}
-        duplicates = []
-
-        for entry in prices_raw_data.get("prices", []):
-            city = entry.get("city", "Unknown")
-            restaurant = entry.get("restaurant_name", "Unknown")
-
-            if city not in seen:
-                seen[city] = set()
-
-            if restaurant in seen[city]:
-                duplicates.append(f"{restaurant} in {city}")
-            else:
-                seen[city].add(restaurant)
+        counts = Counter(
+            (entry.get("city", "Unknown"), entry.get("restaurant_name", "Unknown"))
+            for entry in prices_raw_data.get("prices", [])
+        )
+        duplicates = [
+            f"{restaurant} in {city}"
+            for (city, restaurant), count in counts.items()
+            if count > 1
+        ]
 
         assert not duplicates, f"Duplicate restaurants found: {', '.join(duplicates)}"
 
@@ -182,9 +155,7 @@ class TestUrlFormat:
 
             if not isinstance(url, str):
                 invalid.append(f"{entry.get('restaurant_name', 'Unknown')}: not a string")
-                continue
-
-            if not url.startswith(("http://", "https://")):
+            elif not url.startswith(URL_PREFIXES):
                 invalid.append(f"{entry.get('restaurant_name', 'Unknown')}: {url}")
 
         assert not invalid, f"Invalid URLs: {'; '.join(invalid)}"
@@ -16,12 +16,24 @@ Usage:
 
 import argparse
 import json
+import re
 import sys
-from datetime import datetime, timedelta
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from statistics import mean, stdev
 from typing import Optional
 
+import numpy as np
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Price sanity bounds (CAD)
 MIN_PRICE = 5.00
 MAX_PRICE = 25.00
@@ -32,27 +44,117 @@ STALE_DAYS = 180  # 6 months
 # Required confidence values
 VALID_CONFIDENCE = {"high", "medium", "low"}
 
+# Accepted source_url prefixes (single startswith call per entry)
+_URL_PREFIXES = ("http://", "https://")
+
+# Only the YYYY-MM-DD form is legal for extraction dates
+_ISO_DATE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+
+# Size keys and their display labels (avoids a capitalize() per message)
+_SIZES = ("small", "regular", "large")
+_SIZE_LABEL = {"small": "Small", "regular": "Regular", "large": "Large"}
+
 
 class ValidationError:
-    """Represents a validation error or warning."""
+    """Represents a validation error or warning.
+
+    The message is stored as a %-template plus args and only rendered
+    when the error is actually printed; --quiet runs that just count
+    errors never pay for formatting.
+    """
 
-    def __init__(self, level: str, restaurant: str, city: str, message: str):
+    def __init__(
+        self, level: str, restaurant: str, city: str, message_template: str, *args
+    ):
         self.level = level  # "error" or "warning"
         self.restaurant = restaurant
         self.city = city
-        self.message = message
+        self.message_template = message_template
+        self.args = args
+
+    @property
+    def message(self) -> str:
+        return self.message_template % self.args if self.args else self.message_template
 
     def __str__(self):
         return f"[{self.level.upper()}] {self.city}/{self.restaurant}: {self.message}"
 
 
+@lru_cache(maxsize=8)
+def _iso(d: date) -> str:
+    """Memoized isoformat; the run only ever uses today and the cutoff."""
+    return d.isoformat()
+
+
+def _is_fresh_date(date_str: str, stale_cutoff_str: str, today_str: str) -> bool:
+    """Fast accept for well-formed dates in [stale_cutoff, today].
+
+    ISO YYYY-MM-DD sorts lexicographically, so fresh data — the common
+    case right after a scrape — needs no parsing at all. The shape and
+    digit checks plus the month and day <= 28 guards keep this exact:
+    any string passing them inside a range bounded by two real dates
+    is a valid calendar date. Everything else falls through to the
+    full parse.
+    """
+    return (
+        len(date_str) == 10
+        and date_str[4] == "-"
+        and date_str[7] == "-"
+        and stale_cutoff_str <= date_str <= today_str
+        and "01" <= date_str[5:7] <= "12"
+        and "01" <= date_str[8:10] <= "28"
+        and date_str[:4].isdigit()
+        and date_str[5:7].isdigit()
+        and date_str[8:10].isdigit()
+    )
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date_str: str) -> date:
+    """Parse a YYYY-MM-DD string, memoized.
+
+    A fullmatch on the precompiled pattern plus the date constructor
+    beats both strptime and fromisoformat for this narrow grammar, and
+    unlike fromisoformat rejects the other ISO-8601 forms. City dumps
+    repeat the same extraction date across many restaurants, so the
+    cache turns most parses into a dict hit.
+    """
+    m = _ISO_DATE.fullmatch(date_str)
+    if not m:
+        raise ValueError(f"invalid date: {date_str!r}")
+    return date(int(m[1]), int(m[2]), int(m[3]))
+
+
 def load_prices(prices_path: Path) -> list[dict]:
-    """Load price data from JSON file."""
-    with open(prices_path) as f:
-        data = json.load(f)
+    """Load price data from JSON file, using orjson when available."""
+    if HAS_ORJSON:
+        data = orjson.loads(prices_path.read_bytes())
+    else:
+        with open(prices_path) as f:
+            data = json.load(f)
     return data.get("prices", [])
 
 
+def save_json(data: dict, path: Path, compact: bool = False) -> None:
+    """
+    Write JSON output, pretty-printed unless compact is requested.
+
+    Serializes to one buffer written to a temp file that is atomically
+    renamed over the target, same as the aggregation pipeline.
+    """
+    if HAS_ORJSON:
+        option = 0 if compact else orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        buf = orjson.dumps(data, option=option)
+    elif compact:
+        buf = json.dumps(data, separators=(",", ":")).encode()
+    else:
+        buf = (json.dumps(data, indent=2) + "\n").encode()
+
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(buf)
+    tmp.replace(path)
+
+
 def validate_required_fields(entry: dict) -> list[ValidationError]:
     """Check that required fields are present."""
     errors = []
@@ -64,7 +166,7 @@ def validate_required_fields(entry: dict) -> list[ValidationError]:
     for field in required:
         if field not in entry or entry[field] is None:
             errors.append(ValidationError(
-                "error", restaurant, city, f"Missing required field: {field}"
+                "error", restaurant, city, "Missing required field: %s", field
             ))
 
     return errors
@@ -80,7 +182,7 @@ def validate_confidence(entry: dict) -> list[ValidationError]:
     if confidence and confidence not in VALID_CONFIDENCE:
         errors.append(ValidationError(
             "error", restaurant, city,
-            f"Invalid confidence value: '{confidence}' (must be high/medium/low)"
+            "Invalid confidence value: '%s' (must be high/medium/low)", confidence
         ))
 
     return errors
@@ -94,10 +196,7 @@ def validate_prices(entry: dict) -> list[ValidationError]:
     prices = entry.get("prices", {})
 
     # Check that at least one price exists
-    has_price = any(
-        prices.get(size) is not None
-        for size in ["small", "regular", "large"]
-    )
+    has_price = any(prices.get(size) is not None for size in _SIZES)
     if not has_price:
         errors.append(ValidationError(
             "error", restaurant, city, "No prices provided"
@@ -117,12 +216,12 @@ def validate_prices(entry: dict) -> list[ValidationError]:
         if price < MIN_PRICE:
             errors.append(ValidationError(
                 "warning", restaurant, city,
-                f"{size.capitalize()} price ${price:.2f} is below minimum (${MIN_PRICE})"
+                "%s price $%.2f is below minimum ($%s)", _SIZE_LABEL.get(size, size), price, MIN_PRICE
             ))
         if price > MAX_PRICE:
             errors.append(ValidationError(
                 "warning", restaurant, city,
-                f"{size.capitalize()} price ${price:.2f} is above maximum (${MAX_PRICE})"
+                "%s price $%.2f is above maximum ($%s)", _SIZE_LABEL.get(size, size), price, MAX_PRICE
             ))
 
     # Check size ordering (small < regular < large)
@@ -133,20 +232,28 @@ def validate_prices(entry: dict) -> list[ValidationError]:
     if small is not None and regular is not None and small >= regular:
         errors.append(ValidationError(
             "warning", restaurant, city,
-            f"Small (${small:.2f}) >= Regular (${regular:.2f})"
+            "Small ($%.2f) >= Regular ($%.2f)", small, regular
         ))
 
     if regular is not None and large is not None and regular >= large:
         errors.append(ValidationError(
             "warning", restaurant, city,
-            f"Regular (${regular:.2f}) >= Large (${large:.2f})"
+            "Regular ($%.2f) >= Large ($%.2f)", regular, large
         ))
 
     return errors
 
 
-def validate_date(entry: dict) -> list[ValidationError]:
-    """Check that extraction date is valid and not stale."""
+def validate_date(
+    entry: dict,
+    today: Optional[date] = None,
+    stale_cutoff: Optional[date] = None,
+) -> list[ValidationError]:
+    """Check that extraction date is valid and not stale.
+
+    Callers validating many entries should pass today/stale_cutoff so
+    the clock is read once per run instead of twice per entry.
+    """
     errors = []
     city = entry.get("city", "Unknown")
     restaurant = entry.get("restaurant_name", "Unknown")
@@ -155,29 +262,37 @@ def validate_date(entry: dict) -> list[ValidationError]:
     if not date_str:
         return errors  # Already caught by required fields check
 
+    if today is None:
+        today = date.today()
+    if stale_cutoff is None:
+        stale_cutoff = today - timedelta(days=STALE_DAYS)
+
+    # Fresh, well-formed dates need no parsing or further checks
+    if _is_fresh_date(date_str, _iso(stale_cutoff), _iso(today)):
+        return errors
+
     try:
-        extraction_date = datetime.strptime(date_str, "%Y-%m-%d")
+        extraction_date = _parse_date(date_str)
     except ValueError:
         errors.append(ValidationError(
             "error", restaurant, city,
-            f"Invalid date format: '{date_str}' (expected YYYY-MM-DD)"
+            "Invalid date format: '%s' (expected YYYY-MM-DD)", date_str
         ))
         return errors
 
     # Check if date is in the future
-    if extraction_date > datetime.now():
+    if extraction_date > today:
         errors.append(ValidationError(
             "error", restaurant, city,
-            f"Extraction date {date_str} is in the future"
+            "Extraction date %s is in the future", date_str
         ))
         return errors
 
     # Check for stale data
-    stale_threshold = datetime.now() - timedelta(days=STALE_DAYS)
-    if extraction_date < stale_threshold:
+    if extraction_date < stale_cutoff:
         errors.append(ValidationError(
             "warning", restaurant, city,
-            f"Data is stale (extracted {date_str}, over {STALE_DAYS} days ago)"
+            "Data is stale (extracted %s, over %s days ago)", date_str, STALE_DAYS
         ))
 
     return errors
@@ -199,50 +314,188 @@ def validate_url(entry: dict) -> list[ValidationError]:
         ))
         return errors
 
-    if not url.startswith(("http://", "https://")):
+    if not url.startswith(_URL_PREFIXES):
         errors.append(ValidationError(
             "error", restaurant, city,
-            f"Invalid URL format: '{url}' (must start with http:// or https://)"
+            "Invalid URL format: '%s' (must start with http:// or https://)", url
         ))
 
     return errors
 
 
+def validate_entry(
+    entry: dict,
+    out_errors: list[ValidationError],
+    today: Optional[date] = None,
+    stale_cutoff: Optional[date] = None,
+) -> None:
+    """
+    Run all per-entry checks in one pass, appending into out_errors.
+
+    Fuses validate_required_fields/confidence/prices/date/url into a
+    single loop body: city and restaurant are extracted once and no
+    intermediate per-check lists are built. The individual functions
+    above are kept for targeted reuse.
+    """
+    if today is None:
+        today = date.today()
+    if stale_cutoff is None:
+        stale_cutoff = today - timedelta(days=STALE_DAYS)
+
+    city = entry.get("city", "Unknown")
+    restaurant = entry.get("restaurant_name", "Unknown")
+    append = out_errors.append
+
+    # Required fields
+    for field in ("city", "restaurant_name", "extraction_date", "prices", "confidence"):
+        if field not in entry or entry[field] is None:
+            append(ValidationError(
+                "error", restaurant, city, "Missing required field: %s", field
+            ))
+
+    # Confidence
+    confidence = entry.get("confidence")
+    if confidence and confidence not in VALID_CONFIDENCE:
+        append(ValidationError(
+            "error", restaurant, city,
+            "Invalid confidence value: '%s' (must be high/medium/low)", confidence
+        ))
+
+    # Prices
+    prices = entry.get("prices", {})
+    small = prices.get("small")
+    regular = prices.get("regular")
+    large = prices.get("large")
+
+    if small is None and regular is None and large is None:
+        append(ValidationError("error", restaurant, city, "No prices provided"))
+    else:
+        if regular is None:
+            append(ValidationError(
+                "warning", restaurant, city, "Missing regular size price"
+            ))
+
+        for size, price in prices.items():
+            if price is None:
+                continue
+            if price < MIN_PRICE:
+                append(ValidationError(
+                    "warning", restaurant, city,
+                    "%s price $%.2f is below minimum ($%s)", _SIZE_LABEL.get(size, size), price, MIN_PRICE
+                ))
+            if price > MAX_PRICE:
+                append(ValidationError(
+                    "warning", restaurant, city,
+                    "%s price $%.2f is above maximum ($%s)", _SIZE_LABEL.get(size, size), price, MAX_PRICE
+                ))
+
+        if small is not None and regular is not None and small >= regular:
+            append(ValidationError(
+                "warning", restaurant, city,
+                "Small ($%.2f) >= Regular ($%.2f)", small, regular
+            ))
+
+        if regular is not None and large is not None and regular >= large:
+            append(ValidationError(
+                "warning", restaurant, city,
+                "Regular ($%.2f) >= Large ($%.2f)", regular, large
+            ))
+
+    # Extraction date
+    date_str = entry.get("extraction_date")
+    # Fresh, well-formed dates skip the parse entirely
+    if date_str and not _is_fresh_date(date_str, _iso(stale_cutoff), _iso(today)):
+        try:
+            extraction_date = _parse_date(date_str)
+        except ValueError:
+            extraction_date = None
+            append(ValidationError(
+                "error", restaurant, city,
+                "Invalid date format: '%s' (expected YYYY-MM-DD)", date_str
+            ))
+
+        if extraction_date is not None:
+            if extraction_date > today:
+                append(ValidationError(
+                    "error", restaurant, city,
+                    "Extraction date %s is in the future", date_str
+                ))
+            elif extraction_date < stale_cutoff:
+                append(ValidationError(
+                    "warning", restaurant, city,
+                    "Data is stale (extracted %s, over %s days ago)", date_str, STALE_DAYS
+                ))
+
+    # Source URL
+    url = entry.get("source_url")
+    if url is not None:
+        if not isinstance(url, str):
+            append(ValidationError(
+                "error", restaurant, city, "source_url must be a string or null"
+            ))
+        elif not url.startswith(_URL_PREFIXES):
+            append(ValidationError(
+                "error", restaurant, city,
+                "Invalid URL format: '%s' (must start with http:// or https://)", url
+            ))
+
+
+def validate_entry_chunk(chunk: list[dict]) -> list[ValidationError]:
+    """Run the fused per-entry checks over one shard of entries.
+
+    Module-level so it pickles cleanly into worker processes.
+    """
+    errors: list[ValidationError] = []
+    today = date.today()
+    stale_cutoff = today - timedelta(days=STALE_DAYS)
+
+    for entry in chunk:
+        validate_entry(entry, errors, today, stale_cutoff)
+
+    return errors
+
+
 def find_outliers(prices: list[dict]) -> list[ValidationError]:
     """Find price outliers using standard deviation."""
     errors = []
 
-    # Group by city
-    city_prices: dict[str, list[tuple[str, float]]] = {}
+    # Single pass collecting parallel columns
+    cities: list[str] = []
+    restaurants: list[str] = []
+    price_values: list[float] = []
     for entry in prices:
         city = entry.get("city")
-        restaurant = entry.get("restaurant_name", "Unknown")
         regular = entry.get("prices", {}).get("regular")
 
         if city and regular is not None:
-            if city not in city_prices:
-                city_prices[city] = []
-            city_prices[city].append((restaurant, regular))
+            cities.append(city)
+            restaurants.append(entry.get("restaurant_name", "Unknown"))
+            price_values.append(regular)
 
-    # Find outliers per city
-    for city, price_list in city_prices.items():
-        if len(price_list) < 3:
-            continue  # Need at least 3 data points
+    if not price_values:
+        return errors
 
-        values = [p[1] for p in price_list]
-        city_mean = mean(values)
-        city_stdev = stdev(values)
+    # Grouped mean/stdev via bincount on the city index — no Python loop
+    # over entries. Centering before squaring keeps the variance stable.
+    values = np.array(price_values, dtype=np.float64)
+    _, inv = np.unique(np.array(cities), return_inverse=True)
+    counts = np.bincount(inv)
+    means = np.bincount(inv, weights=values) / counts
+    sq_dev = np.bincount(inv, weights=(values - means[inv]) ** 2)
+    stdevs = np.sqrt(sq_dev / np.maximum(counts - 1, 1))
 
-        if city_stdev == 0:
-            continue
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z_scores = np.abs(values - means[inv]) / stdevs[inv]
 
-        for restaurant, price in price_list:
-            z_score = abs(price - city_mean) / city_stdev
-            if z_score > 2:
-                errors.append(ValidationError(
-                    "warning", restaurant, city,
-                    f"Outlier: ${price:.2f} is {z_score:.1f} std devs from city mean ${city_mean:.2f}"
-                ))
+    # Need at least 3 data points per city and non-zero spread
+    outliers = (z_scores > 2) & (counts[inv] >= 3) & (stdevs[inv] > 0)
+
+    for i in np.flatnonzero(outliers):
+        errors.append(ValidationError(
+            "warning", restaurants[i], cities[i],
+            "Outlier: $%.2f is %.1f std devs from city mean $%.2f",
+            values[i], z_scores[i], means[inv[i]]
+        ))
 
     return errors
 
@@ -250,63 +503,82 @@ def find_outliers(prices: list[dict]) -> list[ValidationError]:
 def find_duplicates(prices: list[dict]) -> list[ValidationError]:
     """Find duplicate restaurant entries within a city."""
     errors = []
-    seen: dict[str, set[str]] = {}  # city -> set of restaurant names
+    seen: set[tuple[str, str]] = set()  # (city, restaurant) pairs
 
     for entry in prices:
         city = entry.get("city", "Unknown")
         restaurant = entry.get("restaurant_name", "Unknown")
 
-        if city not in seen:
-            seen[city] = set()
-
-        if restaurant in seen[city]:
+        key = (city, restaurant)
+        if key in seen:
             errors.append(ValidationError(
                 "error", restaurant, city, "Duplicate restaurant entry"
             ))
         else:
-            seen[city].add(restaurant)
+            seen.add(key)
 
     return errors
 
 
-def validate_all(prices: list[dict]) -> list[ValidationError]:
-    """Run all validation checks."""
-    all_errors = []
+def validate_all(
+    prices: list[dict],
+    jobs: int = 1,
+) -> tuple[list[ValidationError], Counter, dict[str, set]]:
+    """Run all validation checks.
+
+    Returns the errors, a {level: count} tally, and the
+    {level: {(city, restaurant)}} key sets used for filtering — all
+    built in one accumulation pass so callers never re-scan the list.
+
+    With jobs > 1 the independent per-entry checks are sharded across
+    processes; the cross-entry passes stay serial since they are
+    already cheap once vectorized.
+    """
+    all_errors: list[ValidationError] = []
+
+    if jobs > 1 and len(prices) > 1:
+        # Contiguous shards keep error order identical to a serial run
+        shard_size = -(-len(prices) // jobs)
+        shards = [
+            prices[i:i + shard_size] for i in range(0, len(prices), shard_size)
+        ]
+        with ProcessPoolExecutor(max_workers=len(shards)) as pool:
+            for chunk_errors in pool.map(validate_entry_chunk, shards):
+                all_errors.extend(chunk_errors)
+    else:
+        # Read the clock once for the whole run
+        today = date.today()
+        stale_cutoff = today - timedelta(days=STALE_DAYS)
 
-    # Per-entry validations
-    for entry in prices:
-        all_errors.extend(validate_required_fields(entry))
-        all_errors.extend(validate_confidence(entry))
-        all_errors.extend(validate_prices(entry))
-        all_errors.extend(validate_date(entry))
-        all_errors.extend(validate_url(entry))
+        # Per-entry validations (single fused pass)
+        for entry in prices:
+            validate_entry(entry, all_errors, today, stale_cutoff)
 
     # Cross-entry validations
     all_errors.extend(find_outliers(prices))
     all_errors.extend(find_duplicates(prices))
 
-    return all_errors
+    counts: Counter = Counter()
+    keys_by_level: dict[str, set] = defaultdict(set)
+    for error in all_errors:
+        counts[error.level] += 1
+        keys_by_level[error.level].add((error.city, error.restaurant))
 
+    return all_errors, counts, keys_by_level
 
-def filter_valid_prices(
-    prices: list[dict],
-    errors: list[ValidationError],
-) -> list[dict]:
-    """Filter out entries with errors (keep those with only warnings)."""
-    # Find entries with errors
-    error_keys = set()
-    for error in errors:
-        if error.level == "error":
-            error_keys.add((error.city, error.restaurant))
-
-    # Keep entries without errors
-    valid = []
-    for entry in prices:
-        key = (entry.get("city", "Unknown"), entry.get("restaurant_name", "Unknown"))
-        if key not in error_keys:
-            valid.append(entry)
 
-    return valid
+def filter_valid_prices(prices: list[dict], error_keys: set) -> list[dict]:
+    """Keep entries whose (city, restaurant) key is not disqualified.
+
+    The key sets come straight from validate_all's accumulation pass,
+    so this is a single filter over the entries with no scan of the
+    error list.
+    """
+    return [
+        entry for entry in prices
+        if (entry.get("city", "Unknown"), entry.get("restaurant_name", "Unknown"))
+        not in error_keys
+    ]
 
 
 def main():
@@ -335,6 +607,17 @@ def main():
         action="store_true",
         help="Only show summary, not individual errors",
     )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Write output without indentation (smaller, machine-oriented)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of processes for per-entry validation (default: 1)",
+    )
     args = parser.parse_args()
 
     # Load prices
@@ -352,36 +635,41 @@ def main():
         print("No price entries to validate.")
         # Write empty validated file
         output_path = script_dir / args.output
-        with open(output_path, "w") as f:
-            json.dump({"validation_date": datetime.now().strftime("%Y-%m-%d"), "prices": []}, f, indent=2)
+        save_json(
+            {"validation_date": datetime.now().strftime("%Y-%m-%d"), "prices": []},
+            output_path,
+            args.compact,
+        )
         return
 
     # Validate
-    errors = validate_all(prices)
+    errors, level_counts, keys_by_level = validate_all(prices, args.jobs)
+    error_count = level_counts["error"]
+    warning_count = level_counts["warning"]
 
-    # Count by level
-    error_count = sum(1 for e in errors if e.level == "error")
-    warning_count = sum(1 for e in errors if e.level == "warning")
-
-    # Display errors
+    # Display errors grouped by city: sorting the small set of city
+    # buckets (and each bucket by restaurant) beats one big Timsort
+    # over every error with a tuple key per comparison
     if not args.quiet:
-        for error in sorted(errors, key=lambda e: (e.city, e.restaurant)):
-            print(error)
+        errors_by_city: dict[str, list[ValidationError]] = defaultdict(list)
+        for error in errors:
+            errors_by_city[error.city].append(error)
+
+        for city in sorted(errors_by_city):
+            bucket = errors_by_city[city]
+            bucket.sort(key=attrgetter("restaurant"))
+            for error in bucket:
+                print(error)
 
     print(f"\nValidation complete: {error_count} errors, {warning_count} warnings")
 
     # Filter valid entries
     if args.strict:
         # In strict mode, warnings are also excluded
-        valid_prices = [
-            p for p in prices
-            if not any(
-                e.city == p.get("city") and e.restaurant == p.get("restaurant_name")
-                for e in errors
-            )
-        ]
+        excluded = keys_by_level["error"] | keys_by_level["warning"]
     else:
-        valid_prices = filter_valid_prices(prices, errors)
+        excluded = keys_by_level["error"]
+    valid_prices = filter_valid_prices(prices, excluded)
 
     print(f"Valid entries: {len(valid_prices)} / {len(prices)}")
 
@@ -392,8 +680,7 @@ def main():
         "prices": valid_prices,
     }
 
-    with open(output_path, "w") as f:
-        json.dump(output_data, f, indent=2)
+    save_json(output_data, output_path, args.compact)
 
     print(f"Saved validated data to {output_path}")
 
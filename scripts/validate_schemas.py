@@ -8,13 +8,41 @@ Usage:
 """
 
 import argparse
+import functools
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import jsonschema
 from jsonschema import Draft7Validator, ValidationError
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+try:
+    import fastjsonschema
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
+# Stream price files larger than this instead of loading them whole
+STREAM_THRESHOLD_BYTES = 50 * 1024 * 1024
+
+# json/orjson decode errors subclass ValueError, but ijson.JSONError
+# does not, so the streaming path has to list it explicitly
+_DECODE_ERRORS: tuple = (ValueError, ijson.JSONError) if HAS_IJSON else (ValueError,)
+
 
 # Mapping of data files to their schemas
 FILE_SCHEMA_MAP = {
@@ -29,11 +57,44 @@ PRICE_SCHEMA = "schemas/price_entry.schema.json"
 
 
 def load_json(path: Path) -> dict:
-    """Load and parse JSON file."""
+    """Load and parse JSON file, using orjson when available."""
+    if HAS_ORJSON:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so
+        # callers' except clauses work unchanged
+        return orjson.loads(path.read_bytes())
     with open(path) as f:
         return json.load(f)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_validator(schema_path: str) -> Draft7Validator:
+    """Load a schema and build its validator once per path."""
+    return Draft7Validator(load_json(Path(schema_path)))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_compiled(schema_path: str):
+    """Compile a schema to a fastjsonschema callable once per path.
+
+    The generated function is much faster than walking the schema per
+    instance, but stops at the first violation — so it serves as a
+    fast accept path, with jsonschema producing the detailed error
+    list only for instances that fail.
+    """
+    return fastjsonschema.compile(load_json(Path(schema_path)))
+
+
+def _instance_errors(instance, schema_path: Path) -> list:
+    """Return jsonschema errors for one instance, fast-accepting valid ones."""
+    if HAS_FASTJSONSCHEMA:
+        try:
+            _get_compiled(str(schema_path))(instance)
+            return []
+        except fastjsonschema.JsonSchemaException:
+            pass  # Fall through for the full error list
+    return list(_get_validator(str(schema_path)).iter_errors(instance))
+
+
 def validate_file(
     data_path: Path,
     schema_path: Path,
@@ -54,14 +115,10 @@ def validate_file(
         return [f"File not found: {data_path}"]
 
     try:
-        schema = load_json(schema_path)
+        validation_errors = _instance_errors(data, schema_path)
     except (json.JSONDecodeError, FileNotFoundError) as e:
         return [f"Schema error: {e}"]
 
-    # Validate
-    validator = Draft7Validator(schema)
-    validation_errors = list(validator.iter_errors(data))
-
     for error in validation_errors:
         path = " -> ".join(str(p) for p in error.absolute_path) or "(root)"
         errors.append(f"{path}: {error.message}")
@@ -82,39 +139,56 @@ def validate_price_entries(
     errors = []
 
     try:
-        data = load_json(data_path)
-    except json.JSONDecodeError as e:
-        return [f"Invalid JSON: {e}"]
-    except FileNotFoundError:
+        _get_validator(str(schema_path))
+    except (json.JSONDecodeError, FileNotFoundError) as e:
+        return [f"Schema error: {e}"]
+
+    if not data_path.exists():
         # Price files may not exist yet
         if verbose:
             print(f"  Skipping (not found): {data_path}")
         return []
 
+    # Stream large files entry by entry so memory stays at O(one entry);
+    # small files are cheaper to load in one shot
+    stream = HAS_IJSON and data_path.stat().st_size > STREAM_THRESHOLD_BYTES
+
+    count = 0
+
     try:
-        schema = load_json(schema_path)
-    except (json.JSONDecodeError, FileNotFoundError) as e:
-        return [f"Schema error: {e}"]
+        if stream:
+            with open(data_path, "rb") as f:
+                for i, entry in enumerate(ijson.items(f, "prices.item")):
+                    count += 1
+                    _validate_entry(entry, i, schema_path, errors)
+        else:
+            data = load_json(data_path)
+            for i, entry in enumerate(data.get("prices", [])):
+                count += 1
+                _validate_entry(entry, i, schema_path, errors)
+    except _DECODE_ERRORS as e:
+        return [f"Invalid JSON: {e}"]
 
-    # Get prices array
-    prices = data.get("prices", [])
-    if not prices:
+    if count == 0:
         if verbose:
             print(f"  No price entries to validate in {data_path}")
-        return []
-
-    # Validate each entry
-    validator = Draft7Validator(schema)
-    for i, entry in enumerate(prices):
-        entry_errors = list(validator.iter_errors(entry))
-        for error in entry_errors:
-            path = " -> ".join(str(p) for p in error.absolute_path) or "(root)"
-            restaurant = entry.get("restaurant_name", f"entry[{i}]")
-            errors.append(f"{restaurant} -> {path}: {error.message}")
 
     return errors
 
 
+def _validate_entry(
+    entry: dict,
+    index: int,
+    schema_path: Path,
+    errors: list[str],
+) -> None:
+    """Validate one price entry, appending messages into errors."""
+    for error in _instance_errors(entry, schema_path):
+        path = " -> ".join(str(p) for p in error.absolute_path) or "(root)"
+        restaurant = entry.get("restaurant_name", f"entry[{index}]")
+        errors.append(f"{restaurant} -> {path}: {error.message}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate JSON data files against schemas"
@@ -128,53 +202,54 @@ def main():
 
     script_dir = Path(__file__).parent.parent
     all_errors = {}
-    files_checked = 0
 
     print("Validating JSON schemas...\n")
 
-    # Validate standard files
+    # Collect the per-file tasks: (label, validator, data path, schema path)
+    tasks = []
     for data_file, schema_file in FILE_SCHEMA_MAP.items():
-        data_path = script_dir / data_file
-        schema_path = script_dir / schema_file
-
-        if not data_path.exists():
+        if not (script_dir / data_file).exists():
             if args.verbose:
                 print(f"Skipping (not found): {data_file}")
             continue
+        tasks.append(
+            (data_file, validate_file, script_dir / data_file, script_dir / schema_file)
+        )
 
-        if args.verbose:
-            print(f"Validating {data_file}...")
-
-        errors = validate_file(data_path, schema_path, args.verbose)
-        files_checked += 1
-
-        if errors:
-            all_errors[data_file] = errors
-            print(f"  FAIL: {data_file} ({len(errors)} errors)")
-        elif args.verbose:
-            print(f"  OK: {data_file}")
-
-    # Validate price files
-    schema_path = script_dir / PRICE_SCHEMA
+    price_schema_path = script_dir / PRICE_SCHEMA
     for price_file in PRICE_FILES:
-        data_path = script_dir / price_file
-
-        if not data_path.exists():
+        if not (script_dir / price_file).exists():
             if args.verbose:
                 print(f"Skipping (not found): {price_file}")
             continue
-
-        if args.verbose:
-            print(f"Validating {price_file}...")
-
-        errors = validate_price_entries(data_path, schema_path, args.verbose)
-        files_checked += 1
-
-        if errors:
-            all_errors[price_file] = errors
-            print(f"  FAIL: {price_file} ({len(errors)} errors)")
-        elif args.verbose:
-            print(f"  OK: {price_file}")
+        tasks.append(
+            (price_file, validate_price_entries, script_dir / price_file, price_schema_path)
+        )
+
+    files_checked = len(tasks)
+
+    # Files are independent and validation is CPU-bound, so fan out
+    # across processes and report results in submission order
+    if tasks:
+        with ProcessPoolExecutor(
+            max_workers=min(len(tasks), os.cpu_count() or 1)
+        ) as pool:
+            futures = [
+                pool.submit(validator, data_path, schema_path)
+                for _, validator, data_path, schema_path in tasks
+            ]
+
+            for (label, _, _, _), future in zip(tasks, futures):
+                if args.verbose:
+                    print(f"Validating {label}...")
+
+                errors = future.result()
+
+                if errors:
+                    all_errors[label] = errors
+                    print(f"  FAIL: {label} ({len(errors)} errors)")
+                elif args.verbose:
+                    print(f"  OK: {label}")
 
     # Summary
     print(f"\nValidation complete: {files_checked} files checked")